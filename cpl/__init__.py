@@ -3,8 +3,8 @@
 A modern, lightweight client for interacting with the CPL API.
 """
 
-from .client import CPLClient
+from .client import AsyncCPLClient, CPLClient, close_shared_client
 
-__all__ = ["CPLClient"]
+__all__ = ["AsyncCPLClient", "CPLClient", "close_shared_client"]
 
 __version__ = "0.1.0"
@@ -1,10 +1,23 @@
 """CPL API Client for accessing CPL data."""
 
-from typing import cast
+import asyncio
+import atexit
+import heapq
+import threading
+import time
+from functools import lru_cache
+from itertools import count
 
 import httpx
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
+from .cache import LRUCache
 from .constants import (
+    CONDITIONAL_CACHE_SIZE,
     CPL_DEFAULT_SEASON_ID,
     CPL_PLAYER_STATS_ENDPOINT,
     CPL_TEAM_STATS_ENDPOINT,
@@ -12,14 +25,25 @@ from .constants import (
     DEFAULT_HEADERS,
     DEFAULT_RT,
     DEFAULT_SEASON_ID,
+    KEEPALIVE_EXPIRY,
     LEADERBOARD_CATEGORIES,
     LEADERBOARD_LIMIT,
-    MATCH_BASE_URL,
-    MATCH_PARAMS,
+    MAX_CONNECTIONS,
+    MAX_KEEPALIVE_CONNECTIONS,
+    MAX_RETRIES,
     PLAYER_CAREER_BASE_URL,
+    PLAYER_STATS_MAX_PAGE_SIZE,
+    PLAYER_STATS_PAGE_SIZE,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL,
+    RETRY_BACKOFF,
+    RETRY_STATUS_CODES,
     ROSTER_BASE_URL,
-    STANDINGS_BASE_URL,
-    TEAM_INFO_BASE_URL,
+    SCHEDULES_URL,
+    STANDINGS_URL,
+    STAT_ID_TO_CATEGORY,
+    TEAM_INFO_URL,
+    TRANSPORT_RETRIES,
     build_url,
     get_random_user_agent,
 )
@@ -32,52 +56,301 @@ from .types import (
     PlayerStatsResponse,
     Schedule,
     Standings,
+    StatEntry,
     TeamInfo,
     TeamRoster,
     TeamStatsResponse,
 )
 
 
+def _pool_limits() -> httpx.Limits:
+    """Connection pool limits shared by the sync and async clients."""
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+def _build_client(timeout: float, headers: dict[str, str]) -> httpx.Client:
+    """Create a pooled HTTP/2 client."""
+    # Pool limits and HTTP/2 live on the transport, since httpx ignores them once a transport is given
+    transport = httpx.HTTPTransport(http2=True, limits=_pool_limits(), retries=TRANSPORT_RETRIES)
+    return httpx.Client(timeout=timeout, headers=headers, transport=transport)
+
+
+_shared_client: httpx.Client | None = None
+_shared_client_lock = threading.Lock()
+
+
+def _get_shared_client(timeout: float) -> httpx.Client:
+    """Return the process-wide client, creating it on first use."""
+    global _shared_client
+
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = _build_client(timeout, {**DEFAULT_HEADERS, "User-Agent": get_random_user_agent()})
+        return _shared_client
+
+
+def close_shared_client() -> None:
+    """Close the process-wide client shared by CPLClient instances.
+
+    Existing instances open a fresh shared pool on their next request.
+    """
+    global _shared_client
+
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
+
+atexit.register(close_shared_client)
+
+
+# ETag, Last-Modified and raw body of a previous response, decoded afresh on each reuse
+_ConditionalEntry = tuple[str | None, str | None, bytes]
+
+
+def _conditional_headers(entry: _ConditionalEntry | None) -> dict[str, str] | None:
+    """Validator headers that let the server answer 304 Not Modified."""
+    if entry is None:
+        return None
+
+    etag, last_modified, _ = entry
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _conditional_entry(response: httpx.Response) -> _ConditionalEntry | None:
+    """Validators and body to remember for a response, if the server sent any validators."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return None
+    return etag, last_modified, response.content
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff delay in seconds before retrying a request."""
+    return RETRY_BACKOFF * 2**attempt
+
+
+@lru_cache(maxsize=8)
+def _team_stats_url(season_id: str) -> str:
+    """Team stats endpoint URL for a season."""
+    return CPL_TEAM_STATS_ENDPOINT.format(season_id=season_id)
+
+
+@lru_cache(maxsize=8)
+def _player_stats_url(season_id: str) -> str:
+    """Player stats endpoint URL for a season."""
+    return CPL_PLAYER_STATS_ENDPOINT.format(season_id=season_id)
+
+
+@lru_cache(maxsize=16)
+def _roster_url(team_id: str) -> str:
+    """Roster endpoint URL for a team."""
+    params = {
+        "tmcl": DEFAULT_SEASON_ID,
+        "_rt": DEFAULT_RT,
+        "detailed": "yes",
+        "_fmt": DEFAULT_FMT,
+        "ctst": team_id,
+    }
+    return build_url(ROSTER_BASE_URL, params)
+
+
+@lru_cache(maxsize=128)
+def _player_career_url(player_id: str) -> str:
+    """Player career endpoint URL for a player."""
+    params = {"prsn": player_id, "_fmt": DEFAULT_FMT, "_rt": DEFAULT_RT}
+    return build_url(PLAYER_CAREER_BASE_URL, params)
+
+
+def _leaderboard_entry(player: PlayerStatsEntry, value: int, ranking: int) -> PlayerLeaderboardEntry:
+    """Build a leaderboard entry for a player."""
+    team = player.get("team", {})
+
+    return {
+        "firstName": player.get("mediaFirstName", ""),
+        "lastName": player.get("mediaLastName", ""),
+        "nationality": player.get("nationality", ""),
+        "nationalityIsoCode": player.get("nationalityIsoCode", ""),
+        "position": player.get("roleLabel", ""),
+        "value": value,
+        "ranking": ranking,
+        "teamAcronym": team.get("acronymName", ""),
+        "teamOfficialName": team.get("officialName", ""),
+        "teamShortName": team.get("shortName", ""),
+    }
+
+
+def _build_leaderboards(players: list[PlayerStatsEntry]) -> dict[str, list[PlayerLeaderboardEntry]]:
+    """Build the top players for each leaderboard category.
+
+    Each category keeps a min-heap of at most ``LEADERBOARD_LIMIT`` candidates while
+    scanning, so a player is only pushed when they beat the current cut-off. Entry
+    dicts are built for the final top players only. Ties keep the earlier player first.
+
+    Args:
+        players: Player stats entries for a season
+
+    Returns:
+        Dictionary mapping category names to lists of top players
+    """
+    heaps: dict[str, list[tuple[int, int, PlayerStatsEntry]]] = {category: [] for category in LEADERBOARD_CATEGORIES}
+    category_of = STAT_ID_TO_CATEGORY.get
+    limit = LEADERBOARD_LIMIT
+    # Negated push order breaks value ties in favour of earlier players and keeps dicts out of comparisons
+    order = count(0, -1)
+
+    for player in players:
+        # A repeated statsId counts once per player, using its last occurrence
+        player_stats: dict[str, StatEntry] = {}
+        for stat in player.get("stats", ()):
+            category = category_of(stat["statsId"])
+            if category is not None:
+                player_stats[category] = stat
+
+        for category, stat in player_stats.items():
+            value = int(stat.get("statsValue", 0))
+            heap = heaps[category]
+            if len(heap) < limit:
+                heapq.heappush(heap, (value, next(order), player))
+            elif value > heap[0][0]:
+                heapq.heapreplace(heap, (value, next(order), player))
+
+    leaderboards: dict[str, list[PlayerLeaderboardEntry]] = {}
+    for category, heap in heaps.items():
+        heap.sort(reverse=True)
+        leaderboards[category] = [
+            _leaderboard_entry(player, value, ranking) for ranking, (value, _, player) in enumerate(heap, 1)
+        ]
+
+    return leaderboards
+
+
 class CPLClient:
     """Client for accessing CPL API data."""
 
-    def __init__(self, timeout: float = 10.0) -> None:
+    __slots__ = (
+        "timeout",
+        "client",
+        "headers",
+        "logger",
+        "_owns_client",
+        "_roster_cache",
+        "_career_cache",
+        "_conditional_cache",
+    )
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        cache_size: int = RESPONSE_CACHE_SIZE,
+        cache_ttl: float | None = RESPONSE_CACHE_TTL,
+        use_shared_client: bool = True,
+    ) -> None:
         """Initialize the CPL API client.
 
         Args:
             timeout: HTTP request timeout in seconds
+            cache_size: Maximum number of rosters and of player careers kept in memory
+            cache_ttl: Seconds a cached roster or career stays valid, or None to never expire
+            use_shared_client: Reuse the process-wide connection pool instead of opening a dedicated one
         """
         self.timeout = timeout
-        self.client = httpx.Client(timeout=self.timeout)
-        self.headers = {**DEFAULT_HEADERS, "User-Agent": get_random_user_agent()}
+        self._owns_client = not use_shared_client
+        if use_shared_client:
+            self._attach_shared_client()
+        else:
+            self.headers = {**DEFAULT_HEADERS, "User-Agent": get_random_user_agent()}
+            self.client = _build_client(timeout, self.headers)
         self.logger = logger
+        self._roster_cache: LRUCache[str, bytes] = LRUCache(cache_size, cache_ttl)
+        self._career_cache: LRUCache[str, bytes] = LRUCache(cache_size, cache_ttl)
+        self._conditional_cache: LRUCache[str, _ConditionalEntry] = LRUCache(CONDITIONAL_CACHE_SIZE)
+
+    def _attach_shared_client(self) -> None:
+        """Point this instance at the process-wide client, rebuilding it if it was closed."""
+        self.client = _get_shared_client(self.timeout)
+        self.headers = {**DEFAULT_HEADERS, "User-Agent": self.client.headers["User-Agent"]}
 
     def _get(self, url: str) -> dict:
-        """Perform a GET request and handle errors.
+        """Perform a GET request and decode the JSON body.
 
         Args:
             url: The API endpoint URL
 
         Returns:
             JSON response data as dictionary
+        """
+        return json_loads(self._get_content(url))
+
+    def _get_content(self, url: str) -> bytes:
+        """Perform a GET request and handle errors.
+
+        Gateway errors and dropped connections are retried with exponential
+        backoff, so the pooled connection survives transient failures. Responses
+        carrying an ETag or Last-Modified header are revalidated on later calls,
+        and a 304 Not Modified reply returns the previously downloaded body.
+
+        Args:
+            url: The API endpoint URL
+
+        Returns:
+            Raw response body
 
         Raises:
             APITimeoutError: When request times out
             RequestError: When HTTP errors occur
         """
-        try:
-            self.logger.debug("Requesting URL: %s with headers: %s", url, self.headers)
-            response = self.client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-
-        except httpx.TimeoutException as te:
-            self.logger.error("Timeout error fetching %s: %s", url, te)
-            raise APITimeoutError(f"Timeout error: {str(te)}") from te
-
-        except httpx.HTTPError as he:
-            self.logger.error("HTTP error fetching %s: %s", url, he)
-            raise RequestError(f"Error fetching data: {str(he)}") from he
+        if not self._owns_client and self.client.is_closed:
+            self._attach_shared_client()
+
+        cached = self._conditional_cache.get(url)
+        attempt = 0
+        while True:
+            try:
+                self.logger.debug("Requesting URL: %s with headers: %s", url, self.headers)
+                response = self.client.get(url, headers=_conditional_headers(cached), timeout=self.timeout)
+                if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+                    self.logger.debug("Not modified: %s", url)
+                    return cached[2]
+
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= MAX_RETRIES:
+                    response.raise_for_status()
+                    self.logger.debug("Content-Encoding for %s: %s", url, response.headers.get("Content-Encoding"))
+                    entry = _conditional_entry(response)
+                    if entry is not None:
+                        self._conditional_cache.set(url, entry)
+                    return response.content
+
+                self.logger.warning("Server error %s fetching %s, retrying", response.status_code, url)
+
+            except (httpx.RemoteProtocolError, httpx.ReadError) as ce:
+                if attempt >= MAX_RETRIES:
+                    self.logger.error("HTTP error fetching %s: %s", url, ce)
+                    raise RequestError(f"Error fetching data: {str(ce)}") from ce
+
+                self.logger.warning("Connection error fetching %s: %s, retrying", url, ce)
+
+            except httpx.TimeoutException as te:
+                self.logger.error("Timeout error fetching %s: %s", url, te)
+                raise APITimeoutError(f"Timeout error: {str(te)}") from te
+
+            except httpx.HTTPError as he:
+                self.logger.error("HTTP error fetching %s: %s", url, he)
+                raise RequestError(f"Error fetching data: {str(he)}") from he
+
+            time.sleep(_retry_delay(attempt))
+            attempt += 1
 
     def _get_players(self) -> list[PlayerStatsEntry]:
         """Get all player stats entries.
@@ -85,16 +358,33 @@ class CPLClient:
         Returns:
             list of player stats entries
         """
-        response = self.get_player_stats() or {}
-        if "players" not in response:
+        response = self.get_player_stats()
+        players = response.get("players") if response else None
+        if not players:
             self.logger.warning("No players data found")
             return []
 
-        return response.get("players", [])
+        return players
 
     def close(self) -> None:
-        """Close the underlying HTTP client."""
-        self.client.close()
+        """Close the underlying HTTP client. Safe to call more than once.
+
+        Clients using the shared connection pool leave it open; call
+        ``close_shared_client`` to shut it down.
+        """
+        if self._owns_client:
+            self.client.close()
+
+    def clear_cache(self) -> None:
+        """Drop all cached rosters and player careers."""
+        self._roster_cache.clear()
+        self._career_cache.clear()
+
+    def __enter__(self) -> "CPLClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def get_standings(self) -> Standings:
         """Retrieve league standings data.
@@ -102,9 +392,9 @@ class CPLClient:
         Returns:
             Standings data
         """
-        url = f"{STANDINGS_BASE_URL}?tmcl={DEFAULT_SEASON_ID}&_rt={DEFAULT_RT}&_fmt={DEFAULT_FMT}&_ordSrt=asc"
+        url = STANDINGS_URL
         data = self._get(url)
-        return cast(Standings, data)
+        return data  # type: ignore[return-value]
 
     def get_schedules(self) -> Schedule:
         """Retrieve match schedules data.
@@ -112,9 +402,9 @@ class CPLClient:
         Returns:
             Schedule data
         """
-        url = build_url(MATCH_BASE_URL, MATCH_PARAMS)
+        url = SCHEDULES_URL
         data = self._get(url)
-        return cast(Schedule, data)
+        return data  # type: ignore[return-value]
 
     def get_team_info(self) -> TeamInfo:
         """Retrieve team information data.
@@ -122,9 +412,9 @@ class CPLClient:
         Returns:
             Team information data
         """
-        url = f"{TEAM_INFO_BASE_URL}?tmcl={DEFAULT_SEASON_ID}&_rt={DEFAULT_RT}&_fmt={DEFAULT_FMT}"
+        url = TEAM_INFO_URL
         data = self._get(url)
-        return cast(TeamInfo, data)
+        return data  # type: ignore[return-value]
 
     def get_roster(self, team_id: str) -> TeamRoster:
         """Retrieve roster for a specific team.
@@ -135,17 +425,14 @@ class CPLClient:
         Returns:
             Team roster data
         """
-        params = {
-            "tmcl": DEFAULT_SEASON_ID,
-            "_rt": DEFAULT_RT,
-            "detailed": "yes",
-            "_fmt": DEFAULT_FMT,
-            "ctst": team_id,
-        }
-        url = build_url(ROSTER_BASE_URL, params)
+        cached = self._roster_cache.get(team_id)
+        if cached is not None:
+            return json_loads(cached)
+
+        url = _roster_url(team_id)
 
         try:
-            return cast(TeamRoster, self._get(url))
+            content = self._get_content(url)
 
         except RequestError as err:
             if "404" in str(err):
@@ -153,6 +440,22 @@ class CPLClient:
                 return {"squad": [], "lastUpdated": ""}
             raise
 
+        self._roster_cache.set(team_id, content)
+        return json_loads(content)
+
+    def get_all_rosters(self, team_ids: list[str]) -> dict[str, TeamRoster]:
+        """Retrieve rosters for several teams over the pooled connection.
+
+        Use ``AsyncCPLClient.get_all_rosters`` to fetch them concurrently.
+
+        Args:
+            team_ids: The teams' unique IDs
+
+        Returns:
+            Dictionary mapping each team ID to its roster data
+        """
+        return {team_id: self.get_roster(team_id) for team_id in team_ids}
+
     def get_team_stats(self, season_id: str = CPL_DEFAULT_SEASON_ID) -> TeamStatsResponse:
         """Retrieve team stats for a given CPL season.
 
@@ -162,7 +465,7 @@ class CPLClient:
         Returns:
             Team stats response containing only the teams data
         """
-        url = CPL_TEAM_STATS_ENDPOINT.format(season_id=season_id)
+        url = _team_stats_url(season_id)
         data = self._get(url)
 
         return {"teams": data["teams"]}
@@ -179,8 +482,8 @@ class CPLClient:
         Returns:
             Player stats response containing only the players data
         """
-        url = CPL_PLAYER_STATS_ENDPOINT.format(season_id=season_id)
-        params = {"pageNumElement": 500}
+        url = _player_stats_url(season_id)
+        params = {"pageNumElement": PLAYER_STATS_MAX_PAGE_SIZE}
         full_url = build_url(url, params)
         resp = self._get(full_url)
 
@@ -195,11 +498,14 @@ class CPLClient:
         Returns:
             Player career stats
         """
-        params = {"prsn": player_id, "_fmt": DEFAULT_FMT, "_rt": DEFAULT_RT}
-        url = build_url(PLAYER_CAREER_BASE_URL, params)
+        cached = self._career_cache.get(player_id)
+        if cached is not None:
+            return json_loads(cached)
+
+        url = _player_career_url(player_id)
 
         try:
-            return cast(PlayerCareerStats, self._get(url))
+            content = self._get_content(url)
 
         except RequestError as err:
             if "404" in str(err):
@@ -209,44 +515,334 @@ class CPLClient:
 
             raise
 
+        self._career_cache.set(player_id, content)
+        return json_loads(content)
+
     def get_leaderboards(self) -> dict[str, list[PlayerLeaderboardEntry]]:
         """Retrieve player leaderboards for different statistical categories.
 
         Returns:
             Dictionary mapping category names to lists of top players
         """
-        players = self._get_players()
+        return _build_leaderboards(self._get_players())
+
+
+class AsyncCPLClient:
+    """Asynchronous client for accessing CPL API data.
+
+    Every getter is a coroutine, so independent requests can be awaited together
+    with ``asyncio.gather`` and share the same connection pool.
+    """
+
+    __slots__ = ("timeout", "client", "headers", "logger", "_roster_cache", "_career_cache", "_conditional_cache")
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        cache_size: int = RESPONSE_CACHE_SIZE,
+        cache_ttl: float | None = RESPONSE_CACHE_TTL,
+    ) -> None:
+        """Initialize the async CPL API client.
+
+        Args:
+            timeout: HTTP request timeout in seconds
+            cache_size: Maximum number of rosters and of player careers kept in memory
+            cache_ttl: Seconds a cached roster or career stays valid, or None to never expire
+        """
+        self.timeout = timeout
+        self.headers = {**DEFAULT_HEADERS, "User-Agent": get_random_user_agent()}
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=_pool_limits(), retries=TRANSPORT_RETRIES)
+        self.client = httpx.AsyncClient(timeout=self.timeout, headers=self.headers, transport=transport)
+        self.logger = logger
+        self._roster_cache: LRUCache[str, bytes] = LRUCache(cache_size, cache_ttl)
+        self._career_cache: LRUCache[str, bytes] = LRUCache(cache_size, cache_ttl)
+        self._conditional_cache: LRUCache[str, _ConditionalEntry] = LRUCache(CONDITIONAL_CACHE_SIZE)
+
+    async def _get(self, url: str) -> dict:
+        """Perform a GET request and decode the JSON body.
+
+        Args:
+            url: The API endpoint URL
 
-        leaderboards: dict[str, list[PlayerLeaderboardEntry]] = {category: [] for category in LEADERBOARD_CATEGORIES}
+        Returns:
+            JSON response data as dictionary
+        """
+        return json_loads(await self._get_content(url))
 
-        for player in players:
-            stats_dict = {stat["statsId"]: stat for stat in player.get("stats", [])}
-            team = player.get("team", {})
+    async def _get_content(self, url: str) -> bytes:
+        """Perform a GET request and handle errors.
 
-            for category, stat_id in LEADERBOARD_CATEGORIES.items():
-                if stat_id in stats_dict:
-                    stat = stats_dict[stat_id]
+        Gateway errors and dropped connections are retried with exponential
+        backoff, so the pooled connection survives transient failures. Responses
+        carrying an ETag or Last-Modified header are revalidated on later calls,
+        and a 304 Not Modified reply returns the previously downloaded body.
 
-                    entry: PlayerLeaderboardEntry = {
-                        "firstName": player.get("mediaFirstName", ""),
-                        "lastName": player.get("mediaLastName", ""),
-                        "nationality": player.get("nationality", ""),
-                        "nationalityIsoCode": player.get("nationalityIsoCode", ""),
-                        "position": player.get("roleLabel", ""),
-                        "value": int(stat.get("statsValue", 0)),
-                        "ranking": 0,
-                        "teamAcronym": team.get("acronymName", ""),
-                        "teamOfficialName": team.get("officialName", ""),
-                        "teamShortName": team.get("shortName", ""),
-                    }
+        Args:
+            url: The API endpoint URL
 
-                    leaderboards[category].append(entry)
+        Returns:
+            Raw response body
+
+        Raises:
+            APITimeoutError: When request times out
+            RequestError: When HTTP errors occur
+        """
+        cached = self._conditional_cache.get(url)
+        attempt = 0
+        while True:
+            try:
+                self.logger.debug("Requesting URL: %s with headers: %s", url, self.headers)
+                response = await self.client.get(url, headers=_conditional_headers(cached))
+                if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+                    self.logger.debug("Not modified: %s", url)
+                    return cached[2]
+
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= MAX_RETRIES:
+                    response.raise_for_status()
+                    self.logger.debug("Content-Encoding for %s: %s", url, response.headers.get("Content-Encoding"))
+                    entry = _conditional_entry(response)
+                    if entry is not None:
+                        self._conditional_cache.set(url, entry)
+                    return response.content
+
+                self.logger.warning("Server error %s fetching %s, retrying", response.status_code, url)
+
+            except (httpx.RemoteProtocolError, httpx.ReadError) as ce:
+                if attempt >= MAX_RETRIES:
+                    self.logger.error("HTTP error fetching %s: %s", url, ce)
+                    raise RequestError(f"Error fetching data: {str(ce)}") from ce
+
+                self.logger.warning("Connection error fetching %s: %s, retrying", url, ce)
+
+            except httpx.TimeoutException as te:
+                self.logger.error("Timeout error fetching %s: %s", url, te)
+                raise APITimeoutError(f"Timeout error: {str(te)}") from te
+
+            except httpx.HTTPError as he:
+                self.logger.error("HTTP error fetching %s: %s", url, he)
+                raise RequestError(f"Error fetching data: {str(he)}") from he
+
+            await asyncio.sleep(_retry_delay(attempt))
+            attempt += 1
+
+    async def _get_players(self) -> list[PlayerStatsEntry]:
+        """Get all player stats entries.
+
+        Returns:
+            list of player stats entries
+        """
+        response = await self.get_player_stats()
+        players = response.get("players") if response else None
+        if not players:
+            self.logger.warning("No players data found")
+            return []
 
-        for category, entries in leaderboards.items():
-            entries.sort(key=lambda x: x["value"], reverse=True)
-            leaderboards[category] = entries[:LEADERBOARD_LIMIT]
+        return players
 
-            for i, entry in enumerate(leaderboards[category], 1):
-                entry["ranking"] = i
+    async def _get_player_stats_unpaged(self, url: str) -> PlayerStatsResponse:
+        """Retrieve a season's player stats in a single request, as CPLClient does.
 
-        return leaderboards
+        Args:
+            url: The season's player stats endpoint URL
+
+        Returns:
+            Player stats response containing only the players data
+        """
+        resp = await self._get(build_url(url, {"pageNumElement": PLAYER_STATS_MAX_PAGE_SIZE}))
+        return {"players": resp["players"]}
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.aclose()
+
+    def clear_cache(self) -> None:
+        """Drop all cached rosters and player careers."""
+        self._roster_cache.clear()
+        self._career_cache.clear()
+
+    async def __aenter__(self) -> "AsyncCPLClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def get_standings(self) -> Standings:
+        """Retrieve league standings data.
+
+        Returns:
+            Standings data
+        """
+        url = STANDINGS_URL
+        data = await self._get(url)
+        return data  # type: ignore[return-value]
+
+    async def get_schedules(self) -> Schedule:
+        """Retrieve match schedules data.
+
+        Returns:
+            Schedule data
+        """
+        url = SCHEDULES_URL
+        data = await self._get(url)
+        return data  # type: ignore[return-value]
+
+    async def get_team_info(self) -> TeamInfo:
+        """Retrieve team information data.
+
+        Returns:
+            Team information data
+        """
+        url = TEAM_INFO_URL
+        data = await self._get(url)
+        return data  # type: ignore[return-value]
+
+    async def get_roster(self, team_id: str) -> TeamRoster:
+        """Retrieve roster for a specific team.
+
+        Args:
+            team_id: The team's unique ID
+
+        Returns:
+            Team roster data
+        """
+        cached = self._roster_cache.get(team_id)
+        if cached is not None:
+            return json_loads(cached)
+
+        url = _roster_url(team_id)
+
+        try:
+            content = await self._get_content(url)
+
+        except RequestError as err:
+            if "404" in str(err):
+                self.logger.warning("Roster not found (404) for team_id: %s", team_id)
+                return {"squad": [], "lastUpdated": ""}
+            raise
+
+        self._roster_cache.set(team_id, content)
+        return json_loads(content)
+
+    async def get_all_rosters(self, team_ids: list[str]) -> dict[str, TeamRoster]:
+        """Retrieve rosters for several teams concurrently.
+
+        Args:
+            team_ids: The teams' unique IDs
+
+        Returns:
+            Dictionary mapping each team ID to its roster data
+        """
+        rosters = await asyncio.gather(*(self.get_roster(team_id) for team_id in team_ids))
+        return dict(zip(team_ids, rosters))
+
+    async def get_team_stats(self, season_id: str = CPL_DEFAULT_SEASON_ID) -> TeamStatsResponse:
+        """Retrieve team stats for a given CPL season.
+
+        Args:
+            season_id: The season ID to get stats for
+
+        Returns:
+            Team stats response containing only the teams data
+        """
+        url = _team_stats_url(season_id)
+        data = await self._get(url)
+
+        return {"teams": data["teams"]}
+
+    async def get_player_stats(
+        self,
+        season_id: str = CPL_DEFAULT_SEASON_ID,
+    ) -> PlayerStatsResponse:
+        """Retrieve player stats for a given CPL season.
+
+        The first page reports the total page count, and the remaining pages are
+        then requested concurrently over the connection pool. When the feed sends
+        no page counts for a full first page, or a later page only repeats players
+        already seen, the season is fetched in one request instead.
+
+        Args:
+            season_id: The season ID to get stats for
+
+        Returns:
+            Player stats response containing only the players data
+        """
+        url = _player_stats_url(season_id)
+        resp = await self._get(build_url(url, {"pageNumElement": PLAYER_STATS_PAGE_SIZE}))
+        players = list(resp["players"])
+
+        pagination = resp.get("pagination")
+        if pagination is None:
+            if len(players) >= PLAYER_STATS_PAGE_SIZE:
+                self.logger.warning("Player stats page is full but has no pagination data, fetching in one request")
+                return await self._get_player_stats_unpaged(url)
+            return {"players": players}
+
+        if not pagination.get("isLastPage", True):
+            first_page = pagination["currentPage"]
+            pages = await asyncio.gather(
+                *(
+                    self._get(build_url(url, {"pageNumElement": PLAYER_STATS_PAGE_SIZE, "pageIndex": page}))
+                    for page in range(first_page + 1, first_page + pagination["totalPages"])
+                )
+            )
+            seen = {player["playerId"] for player in players}
+            for page_resp in pages:
+                new_players = [player for player in page_resp["players"] if player["playerId"] not in seen]
+                if page_resp["players"] and not new_players:
+                    self.logger.warning("Player stats page repeated earlier players, fetching in one request")
+                    return await self._get_player_stats_unpaged(url)
+                seen.update(player["playerId"] for player in new_players)
+                players.extend(new_players)
+
+        return {"players": players}
+
+    async def get_player_career(self, player_id: str) -> PlayerCareerStats:
+        """Retrieve career and detailed info for a specific player.
+
+        Args:
+            player_id: The player's unique ID
+
+        Returns:
+            Player career stats
+        """
+        cached = self._career_cache.get(player_id)
+        if cached is not None:
+            return json_loads(cached)
+
+        url = _player_career_url(player_id)
+
+        try:
+            content = await self._get_content(url)
+
+        except RequestError as err:
+            if "404" in str(err):
+                self.logger.warning("Player career not found (404) for player_id: %s", player_id)
+
+                return {"person": [], "lastUpdated": ""}
+
+            raise
+
+        self._career_cache.set(player_id, content)
+        return json_loads(content)
+
+    async def get_leaderboards(self) -> dict[str, list[PlayerLeaderboardEntry]]:
+        """Retrieve player leaderboards for different statistical categories.
+
+        Returns:
+            Dictionary mapping category names to lists of top players
+        """
+        return _build_leaderboards(await self._get_players())
+
+    async def get_dashboard(self) -> tuple[Standings, Schedule, TeamStatsResponse, PlayerStatsResponse]:
+        """Retrieve standings, schedules, team stats and player stats concurrently.
+
+        Returns:
+            Tuple of standings, schedule, team stats and player stats data
+        """
+        standings, schedules, team_stats, player_stats = await asyncio.gather(
+            self.get_standings(),
+            self.get_schedules(),
+            self.get_team_stats(),
+            self.get_player_stats(),
+        )
+        return standings, schedules, team_stats, player_stats
@@ -25,6 +25,12 @@ CPL_STATS_BASE_URL = "https://api-sdp.canpl.ca/v1/cpl/football"
 CPL_TEAM_STATS_ENDPOINT = f"{CPL_STATS_BASE_URL}/seasons/{{season_id}}/stats/teams"
 CPL_PLAYER_STATS_ENDPOINT = f"{CPL_STATS_BASE_URL}/seasons/{{season_id}}/stats/players"
 
+# Page size used when the player stats are fetched concurrently page by page
+PLAYER_STATS_PAGE_SIZE = 100
+
+# Page size large enough to return a whole season's player stats in one request
+PLAYER_STATS_MAX_PAGE_SIZE = 500
+
 # Query parameters for the match schedule endpoint
 MATCH_PARAMS = {
     "tmcl": DEFAULT_SEASON_ID,
@@ -36,10 +42,30 @@ MATCH_PARAMS = {
 }
 
 
+# Connection pool settings shared by every request to the CPL hosts
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30.0
+TRANSPORT_RETRIES = 2
+
+# Per-client caches for roster and player career responses
+RESPONSE_CACHE_SIZE = 128
+RESPONSE_CACHE_TTL = 300.0
+
+# Number of URLs whose ETag/Last-Modified validators and bodies are kept for conditional requests
+CONDITIONAL_CACHE_SIZE = 64
+
+# Retry policy for transient server and connection errors
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.1
+
+
 DEFAULT_HEADERS = {
     "Origin": "https://canpl.ca",
     "Referer": "https://canpl.ca/",
     "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Accept-Encoding": "br, gzip",
 }
 
 
@@ -50,8 +76,15 @@ USER_AGENTS = [
 ]
 
 
+# Private generator so picking a user agent never touches the global random state
+_USER_AGENT_RANDOM = random.Random()
+
+
 def get_random_user_agent() -> str:
-    return random.choice(USER_AGENTS)
+    """
+    Pick a user agent. Clients call this once at construction, so each client keeps one user agent.
+    """
+    return _USER_AGENT_RANDOM.choice(USER_AGENTS)
 
 
 def build_url(base: str, params: dict) -> str:
@@ -61,6 +94,12 @@ def build_url(base: str, params: dict) -> str:
     return f"{base}?{urllib.parse.urlencode(params)}"
 
 
+# Fully built URLs for endpoints whose query never changes
+STANDINGS_URL = f"{STANDINGS_BASE_URL}?tmcl={DEFAULT_SEASON_ID}&_rt={DEFAULT_RT}&_fmt={DEFAULT_FMT}&_ordSrt=asc"
+TEAM_INFO_URL = f"{TEAM_INFO_BASE_URL}?tmcl={DEFAULT_SEASON_ID}&_rt={DEFAULT_RT}&_fmt={DEFAULT_FMT}"
+SCHEDULES_URL = build_url(MATCH_BASE_URL, MATCH_PARAMS)
+
+
 LEADERBOARD_CATEGORIES: dict[str, str] = {
     "GOALS": "goals",
     "ASSISTS": "assists",
@@ -72,4 +111,7 @@ LEADERBOARD_CATEGORIES: dict[str, str] = {
     "YELLOW_CARDS": "yellow-cards",
 }
 
+# Reverse lookup so a player's stats list can be scanned once
+STAT_ID_TO_CATEGORY: dict[str, str] = {stat_id: category for category, stat_id in LEADERBOARD_CATEGORIES.items()}
+
 LEADERBOARD_LIMIT = 5
@@ -125,8 +125,8 @@ class OverUnderRanking(BaseContestant, total=False):
     goalsAverage: str
 
 
-class Division(TypedDict):
-    """Type hint for Division"""
+class RankingDivision(TypedDict):
+    """Type hint for a league table Division"""
 
     type: Literal[
         "total",
@@ -138,10 +138,26 @@ class Division(TypedDict):
         "half-time-total",
         "half-time-home",
         "half-time-away",
-        "attendance",
-        "over-under",
     ]
-    ranking: list[TotalRanking | StandardRanking | AttendanceRanking | OverUnderRanking]
+    ranking: list[TotalRanking | StandardRanking]
+
+
+class AttendanceDivision(TypedDict):
+    """Type hint for an attendance Division"""
+
+    type: Literal["attendance"]
+    ranking: list[AttendanceRanking]
+
+
+class OverUnderDivision(TypedDict):
+    """Type hint for an over/under goals Division"""
+
+    type: Literal["over-under"]
+    ranking: list[OverUnderRanking]
+
+
+# Tagged by "type", so checking a division's type narrows its ranking rows
+Division = RankingDivision | AttendanceDivision | OverUnderDivision
 
 
 class Stage(TypedDict):
@@ -235,6 +251,7 @@ class EventBase(TypedDict):
     lastUpdated: str
     timestamp: str
     type: NotRequired[str]
+    optaEventId: NotRequired[str]
 
 
 class Goal(EventBase, total=False):
@@ -244,14 +261,12 @@ class Goal(EventBase, total=False):
     awayScore: int
     assistPlayerId: str
     assistPlayerName: str
-    optaEventId: str
 
 
 class Card(EventBase, total=False):
     cardReason: str
     playerId: str
     playerName: str
-    optaEventId: str
 
 
 class Substitute(EventBase, total=False):
@@ -474,6 +489,7 @@ class Kit(TypedDict):
     shirtColour3: NotRequired[str | None]
     shortsColour1: str
     socksColour1: str
+    socksColour2: NotRequired[str | None]
 
 
 class TeamKits(TypedDict):